@@ -2,10 +2,17 @@
 # (Includes sorting, auto-clear status, AND user-selectable font size)
 
 import customtkinter as ctk
+import bisect
 import json
+import math
 import os
 from datetime import date, datetime
-import random
+import functools
+
+try:
+    import orjson # Optional: much faster JSON (de)serialization
+except ImportError:
+    orjson = None
 
 # --- Constants ---
 MAX_GOALS = 10
@@ -19,24 +26,50 @@ ENCOURAGING_WORDS = [
     "Keep up the momentum!",
 ]
 STATUS_CLEAR_DELAY_MS = 5000 # milliseconds (5 seconds)
+SETTINGS_SAVE_DELAY_MS = 500 # Debounce delay for writing settings.json
 DEFAULT_FONT_SIZE = 16 # Default if no setting is found
 MIN_FONT_SIZE = 12
 MAX_FONT_SIZE = 24
 FONT_SIZE_INCREMENT = 2
+VIEWPORT_ROW_BUFFER = 2 # Extra goal rows rendered above/below the visible area
+ROW_PADY = (3, 4) # Vertical padding around each goal row
+INFO_TEMPLATE = "📌 %s (Since: %s)\n   └── %s - %s" # name, date, elapsed, encouragement
+INFO_LINE_COUNT = INFO_TEMPLATE.count("\n") + 1 # Text lines per goal row
+DELETE_BUTTON_HEIGHT = 28 # CTkButton's default height, used for the row delete buttons
+DELETE_BUTTON_BORDER_SPACING = 2 # CTkButton's default space between border and text
+DELETE_BUTTON_BORDER_WIDTH = 0 # Borderless, as in the default theme
 AVAILABLE_FONT_SIZES = [str(s) for s in range(MIN_FONT_SIZE, MAX_FONT_SIZE + 1, FONT_SIZE_INCREMENT)]
 
 # --- Helper Functions ---
-# (calculate_time_elapsed and get_random_encouragement remain the same)
-def calculate_time_elapsed(start_date_str):
+# (calculate_time_elapsed caches per day; get_random_encouragement imports random lazily)
+def calculate_time_elapsed(start_date_str, today_ordinal=None):
     """Calculates time elapsed since the start_date_str (YYYY-MM-DD)."""
+    if not isinstance(start_date_str, str):
+        # Checked before the cache, which would otherwise fail hashing e.g. a list from JSON
+        print(f"Error calculating time: invalid date value {start_date_str!r}")
+        return "Error calculating time", None
+    if today_ordinal is None:
+        today_ordinal = date.today().toordinal()
+    result = _elapsed_cached(start_date_str, today_ordinal)
+    if result is None:
+        # Future date: formatted here, uncached, so the shown clock time stays current
+        now_str = datetime.now().strftime("%Y-%m-%d %H:%M")
+        return f"Date {start_date_str} is in the future (current time: {now_str}).", None
+    return result
+
+@functools.lru_cache(maxsize=128)
+def _elapsed_cached(start_date_str, today_ordinal):
+    """Cached worker for calculate_time_elapsed; today_ordinal keys the cache per day.
+
+    Returns None for future dates, whose message includes the current time.
+    """
     try:
         start_date = date.fromisoformat(start_date_str)
-        today = date.today()
+        today = date.fromordinal(today_ordinal)
         delta = today - start_date
 
         if delta.days < 0:
-            now_str = datetime.now().strftime("%Y-%m-%d %H:%M")
-            return f"Date {start_date_str} is in the future (current time: {now_str}).", None
+            return None
 
         years = delta.days // 365
         remaining_days = delta.days % 365
@@ -63,9 +96,53 @@ def calculate_time_elapsed(start_date_str):
         print(f"Error calculating time: {e}")
         return "Error calculating time", None
 
+def goal_sort_key(goal):
+    """Sort key for goals: the date string, chronological because stored dates are normalized YYYY-MM-DD."""
+    # Plain string compare; no date.fromisoformat parse or date object per goal.
+    # (str() so a hand-edited non-string date can't break the sort with a TypeError)
+    return str(goal.get('date', '9999-12-31'))
+
+def json_dumps(data, pretty=False):
+    """Serializes data to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    # Compact separators keep json on its C encoder fast path
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode("utf-8")
+
+def json_loads(raw):
+    """Parses JSON from bytes or str, using orjson when it is installed."""
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def write_json_atomic(path, data, pretty=False):
+    """Writes data as JSON to a temp file, then renames it over path (atomic on POSIX)."""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(json_dumps(data, pretty))
+            f.flush()
+            os.fsync(f.fileno()) # Data must be on disk before the rename makes it visible
+        os.replace(tmp_path, path)
+    except Exception:
+        # Don't leave a stray .tmp file behind; the caller reports the error
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def get_random_encouragement():
     """Returns a random encouraging phrase."""
-    return random.choice(ENCOURAGING_WORDS)
+    # Import random on first use only; it is not needed to show the window
+    rng = get_random_encouragement._random
+    if rng is None:
+        import random
+        rng = get_random_encouragement._random = random
+    return rng.choice(ENCOURAGING_WORDS)
+
+get_random_encouragement._random = None
 
 
 # --- Main Application Class ---
@@ -80,14 +157,25 @@ class GoalsApp(ctk.CTk):
         self.title("Goals! - Keep Track & Stay Motivated")
         # Increased default size slightly more for UI elements
         self.geometry("750x650")
-        ctk.set_appearance_mode("System")
+        # Appearance mode can probe the OS theme, so apply it after the first paint.
+        # The color theme stays here: it must be set before any widget is created.
+        self.after_idle(ctk.set_appearance_mode, "System")
         ctk.set_default_color_theme("blue")
+        self.protocol("WM_DELETE_WINDOW", self.on_close) # Flush debounced saves on exit
 
         self.goals = []
+        self._names_lower = set() # Lowercased goal names, rebuilt by load_goals
+        self._encouragement_for = {} # id(goal) -> encouragement chosen for that goal
         self.status_clear_job = None
+        self._save_settings_job = None # Pending debounced settings write
         self.current_font_size = DEFAULT_FONT_SIZE # Set default first
+        self._row_widgets = [] # Pool of reusable goal row widgets (info_label/delete_button/index/today_ord)
+        self._viewport_job = None # Pending idle refresh of the visible goal rows
+        self._row_height = 0 # Goal row height from font metrics (0 = not computed yet)
+        self._spaced_rows = 0 # Number of display_frame rows with a reserved minsize
+        self.no_goals_label = None # Created on first empty-list redraw
 
-        # --- Font Tuples (will be updated based on current_font_size) ---
+        # --- Shared CTkFont objects (resized in place when current_font_size changes) ---
         self.REGULAR_FONT = None
         self.INPUT_FONT = None
         self.BUTTON_FONT = None
@@ -96,7 +184,7 @@ class GoalsApp(ctk.CTk):
         self.FRAME_LABEL_FONT = None
         # --- Load Settings and Initial Font Update ---
         self.load_settings() # Load saved font size, overrides default if successful
-        self._update_font_tuples(self.current_font_size) # Create initial font tuples
+        self._update_fonts(self.current_font_size) # Create the shared fonts
 
         # --- Load Goals ---
         self.load_goals() # Load goal data
@@ -160,7 +248,11 @@ class GoalsApp(ctk.CTk):
             label_font=self.FRAME_LABEL_FONT # Use specific font for the frame label
         )
         self.display_frame.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
-        self.display_frame.grid_columnconfigure(0, weight=1)
+        self.display_frame.grid_columnconfigure(0, weight=1) # Goal info labels
+        self.display_frame.grid_columnconfigure(1, weight=0) # Delete buttons
+        # Refresh the visible rows whenever the list scrolls (wheel, scrollbar) or is resized
+        self.display_frame._parent_canvas.configure(yscrollcommand=self._on_canvas_yscroll)
+        self.display_frame._parent_canvas.bind("<Configure>", self._schedule_viewport_refresh, add="+")
 
         # --- Status Label ---
         self.status_label = ctk.CTkLabel(self, text="", text_color="gray", font=self.STATUS_FONT)
@@ -172,36 +264,42 @@ class GoalsApp(ctk.CTk):
 
     # --- Font and Settings Handling ---
 
-    def _update_font_tuples(self, base_size):
-        """Updates the font tuples based on the base size."""
+    def _update_fonts(self, base_size):
+        """Creates the shared CTkFont objects, or resizes them in place for a new base size."""
         # Adjust relative sizes as needed
         info_size = base_size + 2
         status_size = base_size - 2 if base_size > MIN_FONT_SIZE else MIN_FONT_SIZE # Prevent status getting too small
         frame_label_size = base_size
 
-        self.REGULAR_FONT = ("", base_size)
-        self.INPUT_FONT = ("", base_size)
-        self.BUTTON_FONT = ("", base_size)
-        self.INFO_DISPLAY_FONT = ("", info_size)
-        self.STATUS_FONT = ("", status_size)
-        self.FRAME_LABEL_FONT = ("", frame_label_size, "bold")
+        if self.REGULAR_FONT is None:
+            # Regular, input and button fonts are always identical, so share one object
+            self.REGULAR_FONT = self.INPUT_FONT = self.BUTTON_FONT = ctk.CTkFont(size=base_size)
+            self.INFO_DISPLAY_FONT = ctk.CTkFont(size=info_size)
+            self.STATUS_FONT = ctk.CTkFont(size=status_size)
+            self.FRAME_LABEL_FONT = ctk.CTkFont(size=frame_label_size, weight="bold")
+        else:
+            # CTk re-renders every widget using these fonts when they are reconfigured
+            self.REGULAR_FONT.configure(size=base_size)
+            self.INFO_DISPLAY_FONT.configure(size=info_size)
+            self.STATUS_FONT.configure(size=status_size)
+            self.FRAME_LABEL_FONT.configure(size=frame_label_size)
         # print(f"Updated fonts: Base={base_size}, Info={info_size}, Status={status_size}") # Debug print
 
     def load_settings(self):
         """Loads settings like font size from the JSON settings file."""
         try:
             if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, 'r') as f:
-                    settings_data = json.load(f)
-                    loaded_size = settings_data.get("font_size", DEFAULT_FONT_SIZE)
-                    # Validate loaded size
-                    if MIN_FONT_SIZE <= loaded_size <= MAX_FONT_SIZE:
-                         self.current_font_size = loaded_size
-                         print(f"Loaded font size: {self.current_font_size}") # Debug
-                    else:
-                         print(f"Warning: Loaded font size {loaded_size} out of range. Using default.")
-                         self.current_font_size = DEFAULT_FONT_SIZE
-                         self.save_settings() # Save the default back
+                with open(SETTINGS_FILE, 'rb') as f:
+                    settings_data = json_loads(f.read())
+                loaded_size = settings_data.get("font_size", DEFAULT_FONT_SIZE)
+                # Validate loaded size
+                if MIN_FONT_SIZE <= loaded_size <= MAX_FONT_SIZE:
+                     self.current_font_size = loaded_size
+                     print(f"Loaded font size: {self.current_font_size}") # Debug
+                else:
+                     print(f"Warning: Loaded font size {loaded_size} out of range. Using default.")
+                     self.current_font_size = DEFAULT_FONT_SIZE
+                     self.save_settings() # Save the default back
             else:
                  # Settings file doesn't exist, use default and save it
                  print("Settings file not found. Using default font size and creating file.")
@@ -219,13 +317,19 @@ class GoalsApp(ctk.CTk):
 
 
     def save_settings(self):
+        """Schedules a debounced save so rapid setting changes only write the final value."""
+        if self._save_settings_job:
+            self.after_cancel(self._save_settings_job)
+        self._save_settings_job = self.after(SETTINGS_SAVE_DELAY_MS, self._do_save_settings)
+
+    def _do_save_settings(self):
         """Saves the current settings (font size) to the JSON file."""
+        self._save_settings_job = None
         settings_data = {
             "font_size": self.current_font_size
         }
         try:
-            with open(SETTINGS_FILE, 'w') as f:
-                json.dump(settings_data, f, indent=4)
+            write_json_atomic(SETTINGS_FILE, settings_data) # Machine-read: compact
             # print(f"Saved font size: {self.current_font_size}") # Debug print
         except Exception as e:
             print(f"Error saving settings to {SETTINGS_FILE}: {e}")
@@ -239,8 +343,10 @@ class GoalsApp(ctk.CTk):
                 if new_size != self.current_font_size:
                     print(f"Changing font size to: {new_size}") # Debug
                     self.current_font_size = new_size
-                    self._update_font_tuples(self.current_font_size)
-                    self._apply_global_font_settings() # Apply changes to UI
+                    self._update_fonts(self.current_font_size) # Widgets pick this up automatically
+                    # Goal rows change height with the font, so recompute the list spacing
+                    self._reset_row_spacing()
+                    self._schedule_viewport_refresh()
                     self.save_settings() # Save the new setting
             else:
                  print(f"Selected font size {new_size} out of range. Reverting.")
@@ -252,32 +358,21 @@ class GoalsApp(ctk.CTk):
              # Revert combobox display
              self.font_size_combobox.set(str(self.current_font_size))
 
-    def _apply_global_font_settings(self):
-        """Applies the current font settings to all relevant static widgets and redraws dynamic ones."""
-        # Configure static widgets
-        self.label_goal.configure(font=self.REGULAR_FONT)
-        self.entry_goal.configure(font=self.INPUT_FONT)
-        self.label_date.configure(font=self.REGULAR_FONT)
-        self.entry_date.configure(font=self.INPUT_FONT)
-        self.add_button.configure(font=self.BUTTON_FONT)
-        self.label_font_size.configure(font=self.REGULAR_FONT)
-        self.font_size_combobox.configure(font=self.INPUT_FONT)
-        self.status_label.configure(font=self.STATUS_FONT)
-        # Configure the scrollable frame's label
-        self.display_frame.configure(label_font=self.FRAME_LABEL_FONT)
-
-        # Redraw the dynamic goal list using the new fonts
-        self.update_display()
+    def on_close(self):
+        """Flushes any pending settings write before the window is destroyed."""
+        if self._save_settings_job:
+            self.after_cancel(self._save_settings_job)
+            self._do_save_settings()
+        self.destroy()
 
     # --- Goal Handling ---
 
     def load_goals(self):
-        """Loads goals from the JSON data file."""
-        # (Implementation remains the same as before)
+        """Loads goals from the JSON data file, normalizing dates and sorting by date."""
         if os.path.exists(DATA_FILE):
             try:
-                with open(DATA_FILE, 'r') as f:
-                    self.goals = json.load(f)
+                with open(DATA_FILE, 'rb') as f:
+                    self.goals = json_loads(f.read())
             except json.JSONDecodeError:
                 self.update_status(f"Warning: Could not read {DATA_FILE}. Starting fresh.", "orange")
                 self.goals = []
@@ -286,78 +381,193 @@ class GoalsApp(ctk.CTk):
                 self.goals = []
         else:
             self.goals = []
+        # Normalize parseable dates (fromisoformat also accepts e.g. 20240105) to
+        # YYYY-MM-DD, so sorting by the raw string stays chronological
+        for goal in self.goals:
+            try:
+                goal['date'] = date.fromisoformat(goal['date']).isoformat()
+            except (KeyError, TypeError, ValueError):
+                pass # Missing/invalid dates are shown as-is
+        # Sort once here; add_goal keeps the list sorted so redraws never need to.
+        self.goals.sort(key=goal_sort_key)
+        # Lowercased names for O(1) duplicate checks in add_goal
+        # (str() so a hand-edited non-string name can't crash startup)
+        self._names_lower = {str(g.get('name', '')).lower() for g in self.goals}
 
     def save_goals(self):
-        """Saves the current goals list to the JSON data file."""
-        # (Implementation remains the same as before)
+        """Saves the current goals list to the JSON data file (atomically, via write_json_atomic)."""
         try:
-            self.goals.sort(key=lambda x: x.get('date', '0000-00-00'))
-            with open(DATA_FILE, 'w') as f:
-                json.dump(self.goals, f, indent=4)
+            # Kept indented so the goals file stays easy to read and hand-edit
+            write_json_atomic(DATA_FILE, self.goals, pretty=True)
         except Exception as e:
             print(f"Error saving goals: {e}")
             self.update_status(f"Error saving goals: {e}", "red")
 
     def update_display(self):
-        """Clears and redraws the goals in the display frame using current font settings."""
-        # (Ensure widgets created here use the dynamic font tuples like self.INFO_DISPLAY_FONT)
-        for widget in self.display_frame.winfo_children():
-            widget.destroy()
+        """Redraws the goal list using current font settings; only rows in the viewport are materialized."""
+        if self._viewport_job:
+            self.after_cancel(self._viewport_job)
+            self._viewport_job = None
+        # Invalidate row assignments so every visible row picks up new text
+        for row in self._row_widgets:
+            row["index"] = None
 
         if not self.goals:
-            no_goals_label = ctk.CTkLabel(
-                self.display_frame,
-                text="No goals added yet. Add one above!",
-                font=self.INFO_DISPLAY_FONT # Use dynamic font
-            )
-            no_goals_label.grid(row=0, column=0, padx=10, pady=10, sticky="w")
+            for row in self._row_widgets:
+                row["info_label"].grid_forget()
+                row["delete_button"].grid_forget()
+            self._update_row_spacing() # Releases the reserved heights of the removed rows
+            if self.no_goals_label is None:
+                self.no_goals_label = ctk.CTkLabel(
+                    self.display_frame,
+                    text="No goals added yet. Add one above!",
+                    font=self.INFO_DISPLAY_FONT # Shared font, resized in place
+                )
+            self.no_goals_label.grid(row=0, column=0, columnspan=2, padx=10, pady=10, sticky="w")
             return
 
-        try:
-            self.goals.sort(key=lambda x: date.fromisoformat(x.get('date', '9999-12-31')))
-        except ValueError:
-             self.update_status("Warning: Invalid date found in saved data during sorting.", "orange")
-             self.goals.sort(key=lambda x: x.get('date', '9999-12-31'))
-
-        for index, goal in enumerate(self.goals):
-            goal_name = goal.get('name', 'Unnamed Goal')
-            goal_date = goal.get('date', 'No Date')
-
-            elapsed_str, _ = calculate_time_elapsed(goal_date)
-            encouragement = get_random_encouragement()
-
-            item_frame = ctk.CTkFrame(self.display_frame)
-            item_frame.grid(row=index, column=0, padx=5, pady=(3, 4), sticky="ew")
-            item_frame.grid_columnconfigure(0, weight=1)
-            item_frame.grid_columnconfigure(1, weight=0)
-
-            info_text = f"📌 {goal_name} (Since: {goal_date})\n   └── {elapsed_str} - {encouragement}"
-            info_label = ctk.CTkLabel(
-                item_frame,
-                text=info_text,
-                justify="left",
-                anchor="w",
-                font=self.INFO_DISPLAY_FONT # Use dynamic font
-            )
-            info_label.grid(row=0, column=0, padx=10, pady=(5,5), sticky="ew")
-
-            delete_button = ctk.CTkButton(
-                item_frame,
-                text="Delete",
-                command=lambda i=index: self.delete_goal(i),
-                width=60,
-                fg_color="#DB3E3E",
-                hover_color="#A92F2F",
-                font=self.BUTTON_FONT # Use dynamic font
+        if self.no_goals_label is not None:
+            self.no_goals_label.grid_forget()
+
+        self._refresh_viewport()
+
+    # --- Goal List Virtualization ---
+
+    def _on_canvas_yscroll(self, first, last):
+        """yscrollcommand for the goals canvas: updates the scrollbar, then the visible rows."""
+        self.display_frame._scrollbar.set(first, last)
+        self._schedule_viewport_refresh()
+
+    def _schedule_viewport_refresh(self, event=None):
+        """Coalesces scroll/resize events into a single viewport refresh when Tk is idle."""
+        if self._viewport_job is None:
+            self._viewport_job = self.after_idle(self._run_viewport_refresh)
+
+    def _run_viewport_refresh(self):
+        self._viewport_job = None
+        self._refresh_viewport()
+
+    def _refresh_viewport(self):
+        """Grids only the rows intersecting the visible viewport, recycling pooled row widgets."""
+        total = len(self.goals)
+        if not total:
+            return
+        self._update_row_spacing()
+
+        top, bottom = self.display_frame._parent_canvas.yview()
+        first = max(0, int(top * total) - VIEWPORT_ROW_BUFFER)
+        last = min(total, math.ceil(bottom * total) + VIEWPORT_ROW_BUFFER) # Exclusive
+
+        today_ord = date.today().toordinal() # Once per refresh, so all rows agree on "today"
+
+        # Keep rows that are still in range and rendered for today; everything else is
+        # free for reuse (a row from before midnight is re-rendered with the new day)
+        shown = set()
+        free_rows = []
+        for row in self._row_widgets:
+            if row["index"] is not None and first <= row["index"] < last and row["today_ord"] == today_ord:
+                shown.add(row["index"])
+            else:
+                row["index"] = None
+                free_rows.append(row)
+
+        for index in range(first, last):
+            if index not in shown:
+                self._render_row(free_rows.pop() if free_rows else None, index, today_ord)
+
+        # Hide (but keep) rows outside the viewport so they can be recycled
+        for row in free_rows:
+            row["info_label"].grid_forget()
+            row["delete_button"].grid_forget()
+
+    def _reset_row_spacing(self):
+        """Drops the reserved row heights so _refresh_viewport recomputes them (e.g. after a font change)."""
+        self._row_height = 0
+        for r in range(self._spaced_rows):
+            self.display_frame.grid_rowconfigure(r, minsize=0)
+        self._spaced_rows = 0
+
+    def _update_row_spacing(self):
+        """Reserves a fixed height for every goal row so unrendered rows still fill the scroll area."""
+        if not self._row_height:
+            # Derive the height from font metrics rather than a widget's allocated size,
+            # which lags behind a CTkFont resize by several idle rounds
+            text_height = INFO_LINE_COUNT * self.INFO_DISPLAY_FONT.metrics("linespace")
+            # CTkButton grows past its set height once text plus its border padding
+            # (max(border_width + 1, border_spacing) per side, as CTk grids it) no longer fits
+            button_height = max(
+                DELETE_BUTTON_HEIGHT,
+                self.BUTTON_FONT.metrics("linespace")
+                + 2 * max(DELETE_BUTTON_BORDER_WIDTH + 1, DELETE_BUTTON_BORDER_SPACING)
             )
-            delete_button.grid(row=0, column=1, padx=(5, 10), pady=5, sticky="e")
+            # CTk scales fonts, heights and grid padding by the widget scaling (e.g. 125%/150% displays)
+            scaling = self.display_frame._get_widget_scaling()
+            self._row_height = math.ceil(scaling * (max(text_height, button_height) + sum(ROW_PADY)))
+
+        total = len(self.goals)
+        for r in range(self._spaced_rows, total):
+            self.display_frame.grid_rowconfigure(r, minsize=self._row_height)
+        for r in range(total, self._spaced_rows):
+            self.display_frame.grid_rowconfigure(r, minsize=0)
+        self._spaced_rows = total
+
+    def _render_row(self, row, index, today_ord):
+        """Shows goal `index` in `row` (a pooled row dict), creating a new row if `row` is None."""
+        goal = self.goals[index]
+        goal_name = goal.get('name', 'Unnamed Goal')
+        goal_date = goal.get('date', 'No Date')
+
+        elapsed_str, _ = calculate_time_elapsed(goal_date, today_ord)
+        # Pick encouragement once per goal so redraws don't re-roll it
+        encouragement = self._encouragement_for.get(id(goal))
+        if encouragement is None:
+            encouragement = self._encouragement_for[id(goal)] = get_random_encouragement()
+        info_text = INFO_TEMPLATE % (goal_name, goal_date, elapsed_str, encouragement)
+
+        if row is None:
+            row = self._create_row_widgets(index, info_text)
+            self._row_widgets.append(row)
+        else:
+            # Reuse an existing row: just update its text and delete target (fonts are shared)
+            row["info_label"].configure(text=info_text)
+            row["delete_button"].configure(command=functools.partial(self.delete_goal, index))
+        row["info_label"].grid(row=index, column=0, padx=(15, 5), pady=ROW_PADY, sticky="ew")
+        row["delete_button"].grid(row=index, column=1, padx=(5, 15), pady=ROW_PADY, sticky="e")
+        row["index"] = index
+        row["today_ord"] = today_ord
+
+    def _create_row_widgets(self, index, info_text):
+        """Creates the label and delete button for one goal row (gridded by _render_row)."""
+        # Widgets go straight into display_frame; a per-row CTkFrame would double the widget count
+        info_label = ctk.CTkLabel(
+            self.display_frame,
+            text=info_text,
+            justify="left",
+            anchor="w",
+            font=self.INFO_DISPLAY_FONT # Shared font, resized in place
+        )
+
+        delete_button = ctk.CTkButton(
+            self.display_frame,
+            text="Delete",
+            command=functools.partial(self.delete_goal, index),
+            width=60,
+            height=DELETE_BUTTON_HEIGHT,
+            border_spacing=DELETE_BUTTON_BORDER_SPACING,
+            border_width=DELETE_BUTTON_BORDER_WIDTH,
+            fg_color="#DB3E3E",
+            hover_color="#A92F2F",
+            font=self.BUTTON_FONT # Shared font, resized in place
+        )
+
+        return {"info_label": info_label, "delete_button": delete_button, "index": None, "today_ord": None}
 
     def add_goal_event(self, event=None):
         # (Implementation remains the same)
         self.add_goal()
 
     def add_goal(self):
-        # (Implementation remains the same)
+        """Validates the input fields and inserts the new goal in date order."""
         goal_name = self.entry_goal.get().strip()
         goal_date_str = self.entry_date.get().strip()
 
@@ -374,17 +584,19 @@ class GoalsApp(ctk.CTk):
             self.update_status("Invalid date format. Use YYYY-MM-DD.", "red")
             return
 
-        for existing_goal in self.goals:
-            if existing_goal.get('name', '').lower() == goal_name.lower():
-                 self.update_status(f"Goal '{goal_name}' already exists.", "orange")
-                 return
+        if goal_name.lower() in self._names_lower:
+            self.update_status(f"Goal '{goal_name}' already exists.", "orange")
+            return
 
         if len(self.goals) >= MAX_GOALS:
             self.update_status(f"Cannot add more than {MAX_GOALS} goals.", "orange")
             return
 
-        new_goal = {"name": goal_name, "date": goal_date_str}
-        self.goals.append(new_goal)
+        # Store the normalized YYYY-MM-DD form so lexical order matches date order
+        new_goal = {"name": goal_name, "date": valid_date.isoformat()}
+        # Insert in date order to keep self.goals sorted
+        bisect.insort(self.goals, new_goal, key=goal_sort_key)
+        self._names_lower.add(goal_name.lower())
         self.save_goals()
         self.update_display()
 
@@ -395,10 +607,12 @@ class GoalsApp(ctk.CTk):
 
 
     def delete_goal(self, index):
-        # (Implementation remains the same)
+        """Removes the goal at index (in sorted order) along with its cached name and encouragement."""
         if 0 <= index < len(self.goals):
             try:
                 removed_goal = self.goals.pop(index)
+                self._names_lower.discard(str(removed_goal.get('name', '')).lower())
+                self._encouragement_for.pop(id(removed_goal), None)
                 self.save_goals()
                 self.update_display()
                 self.update_status(f"Goal '{removed_goal.get('name', 'Unknown')}' deleted.", "#A9A9A9")
@@ -414,20 +628,22 @@ class GoalsApp(ctk.CTk):
 
 
     def update_status(self, message, color="gray"):
-        # (Implementation remains the same)
-        self.status_label.configure(text=message, text_color=color) # Font is handled by apply_global_font_settings
+        """Shows a status message; non-error messages are cleared after STATUS_CLEAR_DELAY_MS."""
+        self.status_label.configure(text=message, text_color=color) # Font is the shared STATUS_FONT, resized by _update_fonts
 
         if self.status_clear_job:
             self.status_label.after_cancel(self.status_clear_job)
 
         if color != "red":
-            self.status_clear_job = self.status_label.after(
-                STATUS_CLEAR_DELAY_MS,
-                lambda: self.status_label.configure(text="")
-            )
+            self.status_clear_job = self.status_label.after(STATUS_CLEAR_DELAY_MS, self._clear_status)
         else:
              self.status_clear_job = None
 
+    def _clear_status(self):
+        """Clears the status label (scheduled by update_status)."""
+        self.status_clear_job = None
+        self.status_label.configure(text="")
+
 # --- Run the App ---
 if __name__ == "__main__":
     app = GoalsApp()